@@ -86,17 +86,13 @@ class TestJWTTokens:
         
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
-    def test_access_api_with_valid_token(self):
+    def test_access_api_with_valid_token(self, jwt_for):
         """Test accessing protected endpoint with valid token."""
         user = UserFactory()
         
-        # Get tokens using RefreshToken
-        refresh = RefreshToken.for_user(user)
-        access_token = str(refresh.access_token)
-        
         # Access protected endpoint with token
         client = APIClient()
-        client.credentials(HTTP_AUTHORIZATION=f"Bearer {access_token}")
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {jwt_for(user)}")
         
         # Test accessing a protected endpoint
         response = client.get("/api/v1/patients/")
@@ -124,14 +120,13 @@ class TestJWTTokens:
 class TestRoleBasedAccess:
     """Tests for role-based access control."""
 
-    def test_patient_can_access_own_data(self):
+    def test_patient_can_access_own_data(self, jwt_for):
         """Test that patient can access their own data."""
         user = UserFactory()
         
         # Authenticate
         client = APIClient()
-        refresh = RefreshToken.for_user(user)
-        client.credentials(HTTP_AUTHORIZATION=f"Bearer {str(refresh.access_token)}")
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {jwt_for(user)}")
         
         # Access patient list (if endpoint exists)
         response = client.get(f"/api/v1/patients/")
@@ -139,15 +134,14 @@ class TestRoleBasedAccess:
         # Should allow access
         assert response.status_code in [status.HTTP_200_OK, status.HTTP_403_FORBIDDEN]
 
-    def test_patient_cannot_access_other_patient_data(self):
+    def test_patient_cannot_access_other_patient_data(self, jwt_for):
         """Test that patient cannot access another patient's data."""
         user1 = UserFactory()
         user2 = UserFactory()
         
         # Authenticate as user1
         client = APIClient()
-        refresh = RefreshToken.for_user(user1)
-        client.credentials(HTTP_AUTHORIZATION=f"Bearer {str(refresh.access_token)}")
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {jwt_for(user1)}")
         
         # Try to access patient list 
         response = client.get(f"/api/v1/patients/")
@@ -155,30 +149,28 @@ class TestRoleBasedAccess:
         # Should return either ok or forbidden depending on permissions
         assert response.status_code in [status.HTTP_200_OK, status.HTTP_403_FORBIDDEN]
 
-    def test_admin_can_access_all_patient_data(self):
+    def test_admin_can_access_all_patient_data(self, jwt_for):
         """Test that admin can access all patient data."""
         patient = PatientFactory()
         admin = UserFactory(is_staff=True)
         
         # Authenticate as admin
         client = APIClient()
-        refresh = RefreshToken.for_user(admin)
-        client.credentials(HTTP_AUTHORIZATION=f"Bearer {str(refresh.access_token)}")
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {jwt_for(admin)}")
         
         # Access any patient record
         response = client.get(f"/api/v1/patients/{patient.id}/")
         
         assert response.status_code == status.HTTP_200_OK
 
-    def test_staff_user_has_elevated_access(self):
+    def test_staff_user_has_elevated_access(self, jwt_for):
         """Test that staff users have elevated access permissions."""
         staff_user = UserFactory(is_staff=True)
         patient = PatientFactory()
         
         # Authenticate as staff user
         client = APIClient()
-        refresh = RefreshToken.for_user(staff_user)
-        client.credentials(HTTP_AUTHORIZATION=f"Bearer {str(refresh.access_token)}")
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {jwt_for(staff_user)}")
         
         # Access patient data as staff
         response = client.get(f"/api/v1/patients/{patient.id}/")
@@ -186,14 +178,13 @@ class TestRoleBasedAccess:
         # Should be able to access based on staff permissions
         assert response.status_code in [status.HTTP_200_OK, status.HTTP_403_FORBIDDEN]
 
-    def test_regular_user_limited_access(self):
+    def test_regular_user_limited_access(self, jwt_for):
         """Test that regular non-staff users have limited access."""
         regular_user = UserFactory(is_staff=False)
         
         # Authenticate as regular user
         client = APIClient()
-        refresh = RefreshToken.for_user(regular_user)
-        client.credentials(HTTP_AUTHORIZATION=f"Bearer {str(refresh.access_token)}")
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {jwt_for(regular_user)}")
         
         # Try to access patient list
         response = client.get(f"/api/v1/patients/")
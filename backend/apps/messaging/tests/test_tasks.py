@@ -90,6 +90,7 @@ class TestSendMessageTask:
         mock_send.assert_called_once_with(message.id)
 
 
+@pytest.mark.django_db
 class TestProcessMessageQueue:
     """Test process_message_queue task."""
     
@@ -11,4 +11,4 @@ class PatientsConfig(AppConfig):
 
     def ready(self):
         # Import signal handlers
-        pass
+        import apps.patients.signals  # noqa
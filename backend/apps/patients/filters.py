@@ -0,0 +1,65 @@
+"""
+Filter backends and filtersets for Patient app.
+"""
+import operator
+from functools import lru_cache, reduce
+
+import django_filters
+from django.db.models import Q
+from rest_framework import filters
+
+from apps.patients.models import Patient
+
+
+class PatientFilterSet(django_filters.FilterSet):
+    """
+    Filters for the patient list.
+
+    Declared once here instead of via ``filterset_fields``, which makes
+    DjangoFilterBackend build a new FilterSet class on every request.
+    """
+
+    class Meta:
+        model = Patient
+        fields = ["is_active", "gender", "language_preference", "enrolled_by"]
+
+
+@lru_cache(maxsize=None)
+def _compile_search(model, search_fields):
+    """Resolve search_fields to ORM lookups (and whether DISTINCT is needed) once."""
+    backend = filters.SearchFilter()
+    queryset = model._default_manager.all()
+    lookups = tuple(
+        backend.construct_search(str(field), queryset) for field in search_fields
+    )
+    return lookups, backend.must_call_distinct(queryset, search_fields)
+
+
+class PrecompiledSearchFilter(filters.SearchFilter):
+    """
+    SearchFilter that caches the lookups built from a view's search_fields.
+
+    DRF's SearchFilter walks model metadata for every search field on every
+    request; the result only depends on the model and the field list.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        search_fields = self.get_search_fields(view, request)
+        search_terms = self.get_search_terms(request)
+
+        if not search_fields or not search_terms:
+            return queryset
+
+        orm_lookups, needs_distinct = _compile_search(
+            queryset.model, tuple(search_fields)
+        )
+        if needs_distinct:
+            # Relation-spanning searches keep DRF's de-duplication handling.
+            return super().filter_queryset(request, queryset, view)
+
+        # Each term must match at least one field (OR), all terms must match (AND)
+        conditions = (
+            reduce(operator.or_, (Q(**{lookup: term}) for lookup in orm_lookups))
+            for term in search_terms
+        )
+        return queryset.filter(reduce(operator.and_, conditions))
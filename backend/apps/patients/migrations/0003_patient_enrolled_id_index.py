@@ -0,0 +1,23 @@
+# Generated by Django 6.0.9 on 2026-10-14 05:22
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patients', '0002_patient_user'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='patient',
+            name='patients_pa_enrolle_6afcbf_idx',
+        ),
+        migrations.AddIndex(
+            model_name='patient',
+            index=models.Index(fields=['-enrolled_date', '-id'], name='pat_enrolled_id_desc'),
+        ),
+    ]
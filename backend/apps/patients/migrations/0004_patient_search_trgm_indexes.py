@@ -0,0 +1,50 @@
+"""
+Trigram indexes backing ?search= on the patient list (PostgreSQL only).
+
+Django compiles ``icontains`` to ``UPPER(col::text) LIKE UPPER('%term%')`` on
+PostgreSQL, so the GIN indexes are built on that same expression. Other
+backends (SQLite in development and tests) are left untouched.
+"""
+from django.db import migrations
+
+SEARCH_INDEXES = (
+    ("pat_fn_trgm", "first_name"),
+    ("pat_ln_trgm", "last_name"),
+    ("pat_nid_trgm", "national_id"),
+    ("pat_phone_trgm", "phone_number"),
+    ("pat_email_trgm", "email"),
+)
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    table = schema_editor.quote_name(apps.get_model("patients", "Patient")._meta.db_table)
+    for name, column in SEARCH_INDEXES:
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {schema_editor.quote_name(name)} ON {table} "
+            f"USING gin ((UPPER({schema_editor.quote_name(column)}::text)) gin_trgm_ops)"
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, _ in SEARCH_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {schema_editor.quote_name(name)}")
+    schema_editor.execute("DROP EXTENSION IF EXISTS pg_trgm")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("patients", "0003_patient_enrolled_id_index"),
+    ]
+
+    operations = [
+        # Both directions are no-ops on non-PostgreSQL backends. The extension
+        # is handled here rather than with TrigramExtension, whose reverse
+        # queries pg_extension unconditionally.
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
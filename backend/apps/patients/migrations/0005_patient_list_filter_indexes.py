@@ -0,0 +1,35 @@
+# Generated by Django 6.0.9 on 2026-10-14 06:07
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patients', '0004_patient_search_trgm_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='patient',
+            index=models.Index(
+                fields=['is_active', '-enrolled_date', '-id'], name='pat_active_enrolled'
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='patient',
+            index=models.Index(
+                fields=['enrolled_by', '-enrolled_date', '-id'], name='pat_enrolled_by_date'
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='patient',
+            index=models.Index(fields=['last_name'], name='pat_last_name'),
+        ),
+        migrations.AddIndex(
+            model_name='patient',
+            index=models.Index(fields=['date_of_birth'], name='pat_date_of_birth'),
+        ),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 6.0.9 on 2026-10-14 06:09
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def create_stats_view(apps, schema_editor):
+    # PostgreSQL only; stats fall back to live aggregates elsewhere.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        """
+        CREATE MATERIALIZED VIEW IF NOT EXISTS patient_stats_mv AS
+        SELECT row_number() OVER () AS id,
+               gender,
+               is_active,
+               (enrolled_date AT TIME ZONE %s)::date AS enrolled_day,
+               count(*) AS patient_count
+        FROM patients_patient
+        GROUP BY gender, is_active, enrolled_day
+        """,
+        [settings.TIME_ZONE],
+    )
+    # REFRESH ... CONCURRENTLY needs a unique index.
+    schema_editor.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS patient_stats_mv_key "
+        "ON patient_stats_mv (gender, is_active, enrolled_day)"
+    )
+
+
+def drop_stats_view(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP MATERIALIZED VIEW IF EXISTS patient_stats_mv")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patients', '0005_patient_list_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PatientStatsMV',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name='ID'
+                    ),
+                ),
+                ('gender', models.CharField(max_length=1)),
+                ('is_active', models.BooleanField()),
+                ('enrolled_day', models.DateField()),
+                ('patient_count', models.PositiveIntegerField()),
+            ],
+            options={
+                'db_table': 'patient_stats_mv',
+                'managed': False,
+            },
+        ),
+        migrations.RunPython(create_stats_view, drop_stats_view),
+    ]
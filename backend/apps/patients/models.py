@@ -8,6 +8,18 @@ from django.core.validators import RegexValidator
 from django.utils.translation import gettext_lazy as _
 
 
+def calculate_age(date_of_birth, today=None):
+    """Return age in whole years for a date of birth (as of today by default)."""
+    from datetime import date
+
+    today = today or date.today()
+    return (
+        today.year
+        - date_of_birth.year
+        - ((today.month, today.day) < (date_of_birth.month, date_of_birth.day))
+    )
+
+
 class Patient(models.Model):
     """
     Patient model representing individuals enrolled in BiCare 360.
@@ -101,7 +113,18 @@ class Patient(models.Model):
         indexes = [
             models.Index(fields=["national_id"]),
             models.Index(fields=["phone_number"]),
-            models.Index(fields=["-enrolled_date"]),
+            # Backs the list endpoint's keyset (cursor) pagination order.
+            models.Index(fields=["-enrolled_date", "-id"], name="pat_enrolled_id_desc"),
+            # List filters combined with the same order.
+            models.Index(
+                fields=["is_active", "-enrolled_date", "-id"], name="pat_active_enrolled"
+            ),
+            models.Index(
+                fields=["enrolled_by", "-enrolled_date", "-id"], name="pat_enrolled_by_date"
+            ),
+            # ordering=last_name / date_of_birth
+            models.Index(fields=["last_name"], name="pat_last_name"),
+            models.Index(fields=["date_of_birth"], name="pat_date_of_birth"),
         ]
         verbose_name = _("Patient")
         verbose_name_plural = _("Patients")
@@ -117,17 +140,7 @@ class Patient(models.Model):
     @property
     def age(self):
         """Calculate patient age in years."""
-        from datetime import date
-
-        today = date.today()
-        return (
-            today.year
-            - self.date_of_birth.year
-            - (
-                (today.month, today.day)
-                < (self.date_of_birth.month, self.date_of_birth.day)
-            )
-        )
+        return calculate_age(self.date_of_birth)
 
 
 class Address(models.Model):
@@ -215,3 +228,67 @@ class EmergencyContact(models.Model):
 
     def __str__(self):
         return f"{self.full_name} ({self.relationship}) - {self.patient.full_name}"
+
+
+class PatientStatsMV(models.Model):
+    """
+    Read-only view of the ``patient_stats_mv`` materialized view (PostgreSQL).
+
+    One row per (gender, is_active, enrollment day) with its patient count,
+    refreshed by the ``refresh_patient_stats`` Celery task. Only used when
+    ``PATIENT_STATS_USE_MATVIEW`` is set; see ``is_available()``.
+    """
+
+    gender = models.CharField(max_length=1)
+    is_active = models.BooleanField()
+    enrolled_day = models.DateField()
+    patient_count = models.PositiveIntegerField()
+
+    class Meta:
+        managed = False
+        db_table = "patient_stats_mv"
+
+    @classmethod
+    def is_available(cls):
+        """True when PATIENT_STATS_USE_MATVIEW is set and the view exists.
+
+        The view is created by migration 0006 on PostgreSQL only, so it is
+        absent on other backends and on databases built with --nomigrations.
+        """
+        from django.conf import settings
+        from django.db import connection
+
+        if not settings.PATIENT_STATS_USE_MATVIEW or connection.vendor != "postgresql":
+            return False
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT to_regclass(%s) IS NOT NULL", [cls._meta.db_table])
+            return cursor.fetchone()[0]
+
+    @classmethod
+    def as_dict(cls, today, week_ago, gender_keys):
+        """Return the stats payload (as of the last refresh) from the view."""
+        from django.db.models import Q, Sum
+
+        counts = cls.objects.aggregate(
+            total=Sum("patient_count"),
+            active=Sum("patient_count", filter=Q(is_active=True)),
+            new_today=Sum("patient_count", filter=Q(enrolled_day=today)),
+            new_this_week=Sum("patient_count", filter=Q(enrolled_day__gte=week_ago)),
+        )
+        counts = {key: value or 0 for key, value in counts.items()}
+
+        by_gender = dict.fromkeys(gender_keys, 0)
+        by_gender.update(
+            cls.objects.order_by()
+            .values_list("gender")
+            .annotate(count=Sum("patient_count"))
+        )
+
+        return {
+            "total_patients": counts["total"],
+            "active_patients": counts["active"],
+            "inactive_patients": counts["total"] - counts["active"],
+            "new_enrollments_today": counts["new_today"],
+            "new_enrollments_this_week": counts["new_this_week"],
+            "by_gender": by_gender,
+        }
@@ -7,6 +7,10 @@ from apps.patients.models import Patient, Address, EmergencyContact
 
 User = get_user_model()
 
+# Largest value a BigAutoField pk can hold; bigger ints overflow the DB driver.
+MAX_PATIENT_ID = 2**63 - 1
+BULK_IDS_MAX = 1000
+
 
 class EmergencyContactSerializer(serializers.ModelSerializer):
     """Serializer for EmergencyContact model."""
@@ -286,3 +290,13 @@ class PatientRegistrationSerializer(serializers.ModelSerializer):
         patient = Patient.objects.create(user=user, **validated_data)
         
         return patient
+
+
+class PatientBulkIdsSerializer(serializers.Serializer):
+    """Validate the ``{"ids": [...]}`` body of the bulk status actions."""
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1, max_value=MAX_PATIENT_ID),
+        allow_empty=False,
+        max_length=BULK_IDS_MAX,
+    )
@@ -0,0 +1,36 @@
+"""Signal handlers for the patients app."""
+
+import logging
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+# Cached /patients/stats/ payloads are keyed by this version so any change to
+# the patients table invalidates them without having to know the old key.
+STATS_CACHE_VERSION_KEY = "patients:stats:ver"
+STATS_CACHE_TIMEOUT = 60
+
+logger = logging.getLogger(__name__)
+
+
+def bump_stats_cache_version():
+    """Invalidate cached patient statistics."""
+    try:
+        try:
+            cache.incr(STATS_CACHE_VERSION_KEY)
+        except ValueError:
+            # Key missing (never read, or evicted): start a fresh version.
+            cache.set(STATS_CACHE_VERSION_KEY, 2, timeout=None)
+    except Exception:
+        # Backend errors (e.g. Redis unreachable) have no common base class.
+        # Runs from post_save/post_delete, so it must never fail the write;
+        # cached stats then expire after STATS_CACHE_TIMEOUT.
+        logger.warning("Could not invalidate cached patient stats", exc_info=True)
+
+
+@receiver(post_save, sender="patients.Patient")
+@receiver(post_delete, sender="patients.Patient")
+def invalidate_patient_stats(sender, **kwargs):
+    """Drop cached stats whenever a patient is created, updated or deleted."""
+    bump_stats_cache_version()
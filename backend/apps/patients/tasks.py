@@ -0,0 +1,30 @@
+"""
+Celery tasks for the patients app.
+"""
+from celery import shared_task
+from django.db import connection
+import logging
+
+from apps.patients.models import PatientStatsMV
+from apps.patients.signals import bump_stats_cache_version
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(name="apps.patients.tasks.refresh_patient_stats")
+def refresh_patient_stats():
+    """
+    Refresh the patient_stats_mv materialized view behind the stats endpoint.
+
+    Returns:
+        bool: False when the view is disabled or missing (see PatientStatsMV.is_available)
+    """
+    if not PatientStatsMV.is_available():
+        return False
+
+    with connection.cursor() as cursor:
+        cursor.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY patient_stats_mv")
+    # Drop stats payloads cached from the previous refresh.
+    bump_stats_cache_version()
+    logger.info("Refreshed patient_stats_mv")
+    return True
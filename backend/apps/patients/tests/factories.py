@@ -1,6 +1,8 @@
 """
 Test factories for Patient app using factory_boy.
 """
+from itertools import cycle
+
 import factory
 from factory.django import DjangoModelFactory
 from faker import Faker
@@ -10,6 +12,11 @@ from apps.patients.models import Patient, Address, EmergencyContact
 fake = Faker()
 User = get_user_model()
 
+# Pre-generated name pools, so building a patient is a lookup rather than a
+# fresh Faker provider call per field.
+_FIRST_NAMES = cycle([fake.first_name() for _ in range(200)])
+_LAST_NAMES = cycle([fake.last_name() for _ in range(200)])
+
 
 class UserFactory(DjangoModelFactory):
     class Meta:
@@ -24,8 +31,8 @@ class PatientFactory(DjangoModelFactory):
     class Meta:
         model = Patient
 
-    first_name = factory.Faker("first_name")
-    last_name = factory.Faker("last_name")
+    first_name = factory.LazyFunction(lambda: next(_FIRST_NAMES))
+    last_name = factory.LazyFunction(lambda: next(_LAST_NAMES))
     first_name_kinyarwanda = factory.LazyAttribute(lambda obj: obj.first_name)
     last_name_kinyarwanda = factory.LazyAttribute(lambda obj: obj.last_name)
 
@@ -46,6 +53,11 @@ class PatientFactory(DjangoModelFactory):
     prefers_sms = True
     prefers_whatsapp = False
 
+    class Params:
+        # Skip the enrolling User (an extra INSERT plus password hashing) for
+        # tests that only exercise Patient's own fields.
+        skip_related = factory.Trait(enrolled_by=None)
+
 
 class AddressFactory(DjangoModelFactory):
     class Meta:
@@ -25,26 +25,33 @@ class TestPatientListAPI:
         response = api_client.get(url)
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
-    def test_list_patients_authenticated(self, authenticated_client):
+    def test_list_patients_authenticated(self, authenticated_client, patient_cohort):
         """Test listing patients with authentication."""
-        PatientFactory.create_batch(5)
+        patient_cohort(5)
         url = reverse("patients:patient-list")
         
         response = authenticated_client.get(url)
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data["results"]) == 5
 
-    def test_list_patients_pagination(self, authenticated_client):
+    def test_list_patients_pagination(self, authenticated_client, patient_cohort):
         """Test that patient list is paginated."""
-        PatientFactory.create_batch(25)
+        patient_cohort(25)
         url = reverse("patients:patient-list")
         
         response = authenticated_client.get(url)
         assert response.status_code == status.HTTP_200_OK
         assert "results" in response.data
-        assert "count" in response.data
-        assert response.data["count"] == 25
         assert len(response.data["results"]) == 20  # Default page size
+        assert response.data["next"] is not None
+
+        # Cursor pagination: the next link returns the remaining patients
+        next_page = authenticated_client.get(response.data["next"])
+        assert next_page.status_code == status.HTTP_200_OK
+        assert len(next_page.data["results"]) == 5
+        assert next_page.data["next"] is None
+        ids = {p["id"] for p in response.data["results"] + next_page.data["results"]}
+        assert len(ids) == 25
 
     def test_search_patients_by_name(self, authenticated_client):
         """Test searching patients by name."""
@@ -5,10 +5,25 @@ Tests limits, special characters, unicode, extreme values, and data validation.
 import pytest
 from datetime import date, timedelta
 from django.core.exceptions import ValidationError
-from django.db import IntegrityError
+from django.db import IntegrityError, connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from apps.patients.models import Patient, Address, EmergencyContact
-from apps.patients.tests.factories import PatientFactory, AddressFactory, UserFactory
+from apps.patients.tests.factories import PatientFactory
+
+
+def _minimal_patient(**overrides):
+    """Build an unsaved Patient with only the required fields set."""
+    fields = {
+        "first_name": "Test",
+        "last_name": "Patient",
+        "date_of_birth": date(1990, 1, 1),
+        "gender": "M",
+        "national_id": "1234567890123456",
+        "phone_number": "+250788123456",
+    }
+    fields.update(overrides)
+    return Patient(**fields)
 
 
 @pytest.mark.django_db
@@ -18,7 +33,7 @@ class TestPatientBoundaryConditions:
     def test_patient_with_very_old_date_of_birth(self):
         """Test patient with very old date of birth (120 years)."""
         old_date = date.today() - timedelta(days=365 * 120)
-        patient = PatientFactory(date_of_birth=old_date)
+        patient = PatientFactory(skip_related=True, date_of_birth=old_date)
         
         assert patient.age >= 119
         assert patient.age <= 120
@@ -26,19 +41,19 @@ class TestPatientBoundaryConditions:
     def test_patient_with_future_date_of_birth(self):
         """Test that future date of birth is allowed (for newborns registered before birth)."""
         future_date = date.today() + timedelta(days=30)
-        patient = PatientFactory(date_of_birth=future_date)
+        patient = PatientFactory(skip_related=True, date_of_birth=future_date)
         
         # Age calculation should handle negative ages
         assert patient.age <= 0
 
     def test_patient_born_today(self):
         """Test patient born today (age = 0)."""
-        patient = PatientFactory(date_of_birth=date.today())
+        patient = PatientFactory(skip_related=True, date_of_birth=date.today())
         assert patient.age == 0
 
     def test_patient_with_leap_year_birthday(self):
         """Test patient born on Feb 29 (leap year)."""
-        patient = PatientFactory(date_of_birth=date(2000, 2, 29))
+        patient = PatientFactory(skip_related=True, date_of_birth=date(2000, 2, 29))
         assert patient.date_of_birth.month == 2
         assert patient.date_of_birth.day == 29
 
@@ -51,50 +66,51 @@ class TestPatientBoundaryConditions:
     def test_national_id_15_digits_fails(self):
         """Test that 15-digit national ID fails validation."""
         with pytest.raises(ValidationError):
-            patient = PatientFactory.build(national_id="123456789012345")
-            patient.full_clean()
+            patient = _minimal_patient(national_id="123456789012345")
+            patient.full_clean(exclude=["enrolled_by"])
 
     def test_national_id_17_digits_fails(self):
         """Test that 17-digit national ID fails validation."""
         with pytest.raises(ValidationError):
-            patient = PatientFactory.build(national_id="12345678901234567")
-            patient.full_clean()
+            patient = _minimal_patient(national_id="12345678901234567")
+            patient.full_clean(exclude=["enrolled_by"])
 
     def test_national_id_with_letters_fails(self):
         """Test that national ID with letters fails validation."""
         with pytest.raises(ValidationError):
-            patient = PatientFactory.build(national_id="123456789012345A")
-            patient.full_clean()
-
-    def test_phone_number_exactly_13_characters(self):
-        """Test phone number with exactly 13 characters (+250XXXXXXXXX)."""
-        patient = PatientFactory(phone_number="+250788123456")
-        patient.full_clean()
-        assert len(patient.phone_number) == 13
-
-    def test_phone_number_without_plus_fails(self):
-        """Test phone number without + prefix fails."""
-        with pytest.raises(ValidationError):
-            patient = PatientFactory.build(phone_number="250788123456")
-            patient.full_clean()
-
-    def test_phone_number_with_wrong_country_code_fails(self):
-        """Test phone number with wrong country code fails."""
-        with pytest.raises(ValidationError):
-            patient = PatientFactory.build(phone_number="+251788123456")
-            patient.full_clean()
+            patient = _minimal_patient(national_id="123456789012345A")
+            patient.full_clean(exclude=["enrolled_by"])
+
+    @pytest.mark.parametrize(
+        "value,ok",
+        [
+            ("+250788123456", True),
+            ("250788123456", False),
+            ("+251788123456", False),
+            ("123456789", False),
+        ],
+        ids=["exactly_13_chars", "without_plus", "wrong_country_code", "invalid_format"],
+    )
+    def test_phone_validation(self, value, ok):
+        """Test that phone numbers must be in +250XXXXXXXXX format."""
+        patient = _minimal_patient(phone_number=value)
+        if ok:
+            patient.full_clean(exclude=["enrolled_by"])
+        else:
+            with pytest.raises(ValidationError):
+                patient.full_clean(exclude=["enrolled_by"])
 
     def test_very_long_first_name(self):
         """Test patient with very long first name (100 characters)."""
         long_name = "A" * 100
-        patient = PatientFactory(first_name=long_name)
+        patient = PatientFactory(skip_related=True, first_name=long_name)
         assert len(patient.first_name) == 100
 
     def test_first_name_exceeding_max_length_truncated_by_db(self):
         """Test that first name exceeding 100 chars is handled by database."""
         long_name = "A" * 150
         # Django should truncate or raise error
-        patient = PatientFactory.build(first_name=long_name)
+        patient = _minimal_patient(first_name=long_name)
         # This would fail at DB level if we try to save
 
     def test_empty_email_allowed(self):
@@ -112,8 +128,8 @@ class TestPatientBoundaryConditions:
     def test_invalid_email_format_fails(self):
         """Test invalid email format fails validation."""
         with pytest.raises(ValidationError):
-            patient = PatientFactory.build(email="invalid-email")
-            patient.full_clean()
+            patient = _minimal_patient(email="invalid-email")
+            patient.full_clean(exclude=["enrolled_by"])
 
 
 @pytest.mark.django_db
@@ -123,6 +139,7 @@ class TestPatientUnicodeAndSpecialCharacters:
     def test_patient_with_kinyarwanda_characters(self):
         """Test patient with Kinyarwanda characters in name."""
         patient = PatientFactory(
+            skip_related=True,
             first_name_kinyarwanda="Uwimana",
             last_name_kinyarwanda="Mukamana"
         )
@@ -131,6 +148,7 @@ class TestPatientUnicodeAndSpecialCharacters:
     def test_patient_with_french_accents(self):
         """Test patient with French accented characters."""
         patient = PatientFactory(
+            skip_related=True,
             first_name="François",
             last_name="Müller"
         )
@@ -138,12 +156,13 @@ class TestPatientUnicodeAndSpecialCharacters:
 
     def test_patient_with_emoji_in_name(self):
         """Test that emoji in name is stored (though not recommended)."""
-        patient = PatientFactory(first_name="John😊")
+        patient = PatientFactory(skip_related=True, first_name="John😊")
         # Should be stored as-is
         assert "😊" in patient.first_name
 
     def test_address_with_special_characters(self):
         """Test address with special characters."""
+        from apps.patients.tests.factories import AddressFactory
         address = AddressFactory(
             village="Village-Name (Section B)",
             landmarks="Near café & restaurant"
@@ -158,6 +177,7 @@ class TestAddressBoundaryConditions:
 
     def test_gps_coordinates_at_rwanda_boundaries(self):
         """Test GPS coordinates at Rwanda's boundaries."""
+        from apps.patients.tests.factories import AddressFactory
         # Rwanda coordinates roughly: lat -2.8 to -1.0, lon 28.8 to 30.9
         address = AddressFactory(
             latitude=-1.9578,  # Kigali
@@ -168,6 +188,7 @@ class TestAddressBoundaryConditions:
 
     def test_gps_coordinates_maximum_precision(self):
         """Test GPS coordinates with maximum decimal places (6)."""
+        from apps.patients.tests.factories import AddressFactory
         address = AddressFactory(
             latitude=-1.957845,  # 6 decimal places
             longitude=30.112765
@@ -178,6 +199,7 @@ class TestAddressBoundaryConditions:
 
     def test_very_long_street_address(self):
         """Test address with very long street address."""
+        from apps.patients.tests.factories import AddressFactory
         long_address = "A" * 500
         address = AddressFactory(street_address=long_address)
         # TextField should handle large text
@@ -185,6 +207,7 @@ class TestAddressBoundaryConditions:
 
     def test_very_long_landmarks_description(self):
         """Test address with very long landmarks description."""
+        from apps.patients.tests.factories import AddressFactory
         long_landmarks = "Near " + ", ".join([f"landmark{i}" for i in range(100)])
         address = AddressFactory(landmarks=long_landmarks)
         assert "landmark99" in address.landmarks
@@ -197,7 +220,7 @@ class TestEmergencyContactBoundaryConditions:
     def test_multiple_primary_contacts_for_same_patient(self):
         """Test that multiple primary contacts can exist (business logic should handle)."""
         from apps.patients.tests.factories import EmergencyContactFactory
-        patient = PatientFactory()
+        patient = PatientFactory(skip_related=True)
         
         # Create two primary contacts
         contact1 = EmergencyContactFactory(patient=patient, is_primary=True)
@@ -208,7 +231,7 @@ class TestEmergencyContactBoundaryConditions:
 
     def test_emergency_contact_with_same_phone_as_patient(self):
         """Test emergency contact with same phone number as patient."""
-        patient = PatientFactory(phone_number="+250788123456")
+        patient = PatientFactory(skip_related=True, phone_number="+250788123456")
         from apps.patients.tests.factories import EmergencyContactFactory
         
         # This should be allowed
@@ -289,16 +312,20 @@ class TestAPIBoundaryConditions:
         )
         
         assert response.status_code == status.HTTP_200_OK
-        patient.refresh_from_db()
+        patient.refresh_from_db(fields=["email", "alt_phone_number"])
         assert patient.email == ""
         assert patient.alt_phone_number == ""
 
     def test_search_with_empty_string(self, authenticated_client):
         """Test searching with empty string."""
-        PatientFactory.create_batch(5)
-        response = authenticated_client.get("/api/v1/patients/?search=")
+        Patient.objects.bulk_create(PatientFactory.build_batch(5, skip_related=True))
+        with CaptureQueriesContext(connection) as ctx:
+            response = authenticated_client.get("/api/v1/patients/?search=")
         
         assert response.status_code == status.HTTP_200_OK
+        # Page query only: the ETag is built from it, cursor pagination needs
+        # no COUNT and the list values() projection has no prefetches.
+        assert len(ctx) == 1
         # Should return all patients
         assert len(response.data["results"]) == 5
 
@@ -306,12 +333,14 @@ class TestAPIBoundaryConditions:
         """Test searching with special characters."""
         PatientFactory(first_name="O'Brien")
         
-        response = authenticated_client.get("/api/v1/patients/?search=O'Brien")
+        with CaptureQueriesContext(connection) as ctx:
+            response = authenticated_client.get("/api/v1/patients/?search=O'Brien")
         assert response.status_code == status.HTTP_200_OK
+        assert len(ctx) == 1
 
-    def test_pagination_edge_cases(self, authenticated_client):
+    def test_pagination_edge_cases(self, authenticated_client, patient_cohort):
         """Test pagination with exactly page_size patients."""
-        PatientFactory.create_batch(20)  # Exactly one page
+        patient_cohort(20)  # Exactly one page
         
         response = authenticated_client.get("/api/v1/patients/")
         assert response.status_code == status.HTTP_200_OK
@@ -324,9 +353,11 @@ class TestAPIBoundaryConditions:
         PatientFactory(email="test@example.com")
         
         # Both should be returned in list
-        response = authenticated_client.get("/api/v1/patients/")
+        with CaptureQueriesContext(connection) as ctx:
+            response = authenticated_client.get("/api/v1/patients/")
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data["results"]) == 2
+        assert len(ctx) == 1
 
 
 @pytest.mark.django_db
@@ -386,5 +417,5 @@ class TestConcurrencyAndRaceConditions:
         response = authenticated_client.post(f"/api/v1/patients/{patient.pk}/deactivate/")
         assert response.status_code == status.HTTP_200_OK
         
-        patient.refresh_from_db()
+        patient.refresh_from_db(fields=["is_active"])
         assert patient.is_active is False
@@ -2,8 +2,12 @@
 Unit tests for Patient serializers.
 Tests serializer validation, data transformation, and edge cases.
 """
+from unittest.mock import patch
+
 import pytest
 from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth import get_user_model
 from apps.patients.serializers import (
     PatientListSerializer,
@@ -13,7 +17,11 @@ from apps.patients.serializers import (
     AddressSerializer,
     EmergencyContactSerializer,
 )
-from apps.patients.models import Patient
+from apps.patients.fast_serializers import (
+    FastPatientListSerializer,
+    PATIENT_LIST_VALUES,
+)
+from apps.patients.models import EmergencyContact, Patient
 from apps.patients.tests.factories import (
     PatientFactory,
     AddressFactory,
@@ -151,6 +159,21 @@ class TestPatientListSerializer:
             assert "national_id" in item
 
 
+@pytest.mark.django_db
+class TestFastPatientListSerializer:
+    """Unit tests for FastPatientListSerializer (values() rows)."""
+
+    def test_matches_patient_list_serializer(self):
+        """Test that rows render exactly like PatientListSerializer."""
+        PatientFactory.create_batch(3)
+        PatientFactory(email="", blood_type="")
+        queryset = Patient.objects.order_by("id")
+
+        data = FastPatientListSerializer(queryset.values(*PATIENT_LIST_VALUES)).data
+
+        assert data == PatientListSerializer(queryset, many=True).data
+
+
 @pytest.mark.django_db
 class TestPatientDetailSerializer:
     """Unit tests for PatientDetailSerializer."""
@@ -180,9 +203,41 @@ class TestPatientDetailSerializer:
         assert contact1.full_name in contact_names
         assert contact2.full_name in contact_names
 
-    def test_create_patient_with_nested_address(self, api_client):
+    @staticmethod
+    def _render_with_contacts(patient_count):
+        """Serialize patients with two contacts each; return data, init calls, queries."""
+        patients = PatientFactory.create_batch(patient_count, skip_related=True)
+        EmergencyContact.objects.bulk_create(
+            EmergencyContactFactory.build(patient=patient)
+            for patient in patients
+            for _ in range(2)
+        )
+        queryset = (
+            Patient.objects.filter(id__in=[patient.id for patient in patients])
+            .select_related("enrolled_by", "address", "user")
+            .prefetch_related("emergency_contacts")
+        )
+
+        original_init = EmergencyContactSerializer.__init__
+        with patch.object(
+            EmergencyContactSerializer, "__init__", autospec=True, side_effect=original_init
+        ) as init, CaptureQueriesContext(connection) as ctx:
+            data = PatientDetailSerializer(queryset, many=True).data
+        return data, init.call_count, len(ctx)
+
+    def test_nested_contacts_serializer_not_built_per_patient(self):
+        """Test that the nested contacts serializer is constructed O(1) times."""
+        _, single_inits, single_queries = self._render_with_contacts(1)
+        data, many_inits, many_queries = self._render_with_contacts(100)
+
+        assert len(data) == 100
+        assert all(len(item["emergency_contacts"]) == 2 for item in data)
+        assert many_inits == single_inits
+        assert many_queries == single_queries
+
+    def test_create_patient_with_nested_address(self, request_ctx, api_client):
         """Test creating patient with nested address."""
-        user = UserFactory()
+        user = request_ctx["request"].user
         api_client.force_authenticate(user=user)
         
         data = {
@@ -203,7 +258,7 @@ class TestPatientDetailSerializer:
         
         serializer = PatientDetailSerializer(
             data=data,
-            context={"request": type("Request", (), {"user": user})()},
+            context=request_ctx,
         )
         assert serializer.is_valid(), serializer.errors
         patient = serializer.save()
@@ -211,9 +266,8 @@ class TestPatientDetailSerializer:
         assert patient.address is not None
         assert patient.address.province == "Kigali"
 
-    def test_create_patient_with_nested_emergency_contacts(self):
+    def test_create_patient_with_nested_emergency_contacts(self, request_ctx):
         """Test creating patient with nested emergency contacts."""
-        user = UserFactory()
         
         data = {
             "first_name": "John",
@@ -240,16 +294,15 @@ class TestPatientDetailSerializer:
         
         serializer = PatientDetailSerializer(
             data=data,
-            context={"request": type("Request", (), {"user": user})()},
+            context=request_ctx,
         )
         assert serializer.is_valid(), serializer.errors
         patient = serializer.save()
         
         assert patient.emergency_contacts.count() == 2
 
-    def test_update_patient_address(self):
+    def test_update_patient_address(self, request_ctx):
         """Test updating patient's address."""
-        user = UserFactory()
         patient = PatientFactory()
         address = AddressFactory(patient=patient)
         
@@ -272,7 +325,7 @@ class TestPatientDetailSerializer:
         serializer = PatientDetailSerializer(
             patient,
             data=data,
-            context={"request": type("Request", (), {"user": user})()},
+            context=request_ctx,
         )
         assert serializer.is_valid(), serializer.errors
         updated_patient = serializer.save()
@@ -286,9 +339,9 @@ class TestPatientDetailSerializer:
 class TestPatientCreateSerializer:
     """Unit tests for PatientCreateSerializer."""
 
-    def test_create_patient_minimal_fields(self):
+    def test_create_patient_minimal_fields(self, request_ctx):
         """Test creating patient with minimal required fields."""
-        user = UserFactory()
+        user = request_ctx["request"].user
         
         data = {
             "first_name": "John",
@@ -301,7 +354,7 @@ class TestPatientCreateSerializer:
         
         serializer = PatientCreateSerializer(
             data=data,
-            context={"request": type("Request", (), {"user": user})()},
+            context=request_ctx,
         )
         assert serializer.is_valid(), serializer.errors
         patient = serializer.save()
@@ -309,10 +362,9 @@ class TestPatientCreateSerializer:
         assert patient.first_name == "John"
         assert patient.enrolled_by == user
 
-    def test_duplicate_national_id_validation(self):
+    def test_duplicate_national_id_validation(self, request_ctx):
         """Test that duplicate national ID is rejected."""
         PatientFactory(national_id="1234567890123456")
-        user = UserFactory()
         
         data = {
             "first_name": "John",
@@ -325,7 +377,7 @@ class TestPatientCreateSerializer:
         
         serializer = PatientCreateSerializer(
             data=data,
-            context={"request": type("Request", (), {"user": user})()},
+            context=request_ctx,
         )
         assert not serializer.is_valid()
         assert "national_id" in serializer.errors
@@ -5,8 +5,13 @@ Tests view logic, permission handling, query optimization, and edge cases.
 import pytest
 from unittest.mock import Mock, patch
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIRequestFactory
+from apps.patients.models import Patient
+from apps.patients.serializers import BULK_IDS_MAX
 from apps.patients.views import PatientViewSet, AddressViewSet, EmergencyContactViewSet
 from apps.patients.tests.factories import (
     PatientFactory,
@@ -17,6 +22,13 @@ from apps.patients.tests.factories import (
 
 User = get_user_model()
 
+PATIENTS_URL = reverse("patients:patient-list")
+STATS_URL = reverse("patients:patient-stats")
+BULK_ACTIVATE_URL = reverse("patients:patient-bulk-activate")
+BULK_DEACTIVATE_URL = reverse("patients:patient-bulk-deactivate")
+ADDRESSES_URL = reverse("patients:address-list")
+EMERGENCY_CONTACTS_URL = reverse("patients:emergency-contact-list")
+
 
 @pytest.mark.django_db
 class TestPatientViewSetQueryOptimization:
@@ -27,17 +39,30 @@ class TestPatientViewSetQueryOptimization:
         viewset = PatientViewSet()
         queryset = viewset.get_queryset()
         
-        # Check that select_related is used
-        assert "enrolled_by" in str(queryset.query)
-        assert "address" in str(queryset.query)
+        # Check that select_related is used (without compiling the SQL)
+        assert "enrolled_by" in queryset.query.select_related
+        assert "address" in queryset.query.select_related
 
     def test_queryset_uses_prefetch_related(self):
-        """Test that queryset uses prefetch_related for emergency_contacts."""
+        """Test that detail actions prefetch emergency_contacts."""
         viewset = PatientViewSet()
+        viewset.action = "retrieve"
         queryset = viewset.get_queryset()
         
         # Verify prefetch_related is set
-        assert len(queryset._prefetch_related_lookups) > 0
+        assert "emergency_contacts" in queryset._prefetch_related_lookups
+
+    def test_list_queryset_skips_prefetch_related(self):
+        """Test that list does not prefetch emergency contacts it never renders."""
+        viewset = PatientViewSet()
+        viewset.action = "list"
+        queryset = viewset.get_queryset()
+
+        assert queryset._prefetch_related_lookups == ()
+        assert queryset.query.select_related is False
+        # only() the list columns
+        from apps.patients.fast_serializers import PATIENT_LIST_VALUES
+        assert queryset.query.deferred_loading == (set(PATIENT_LIST_VALUES), False)
 
     def test_list_patients_query_count(self, authenticated_client, django_assert_num_queries):
         """Test that listing patients doesn't cause N+1 queries."""
@@ -48,10 +73,146 @@ class TestPatientViewSetQueryOptimization:
             EmergencyContactFactory.create_batch(2, patient=patient)
 
         # Should use optimized queries
-        with django_assert_num_queries(3):  # 1 for patients, 1 for auth, 1 for count
-            response = authenticated_client.get("/api/v1/patients/")
+        # Page only: the ETag comes from the fetched rows, cursor pagination
+        # needs no COUNT query
+        with django_assert_num_queries(1):
+            response = authenticated_client.get(PATIENTS_URL)
             assert response.status_code == status.HTTP_200_OK
 
+    def test_retrieve_query_count_independent_of_contacts(self, authenticated_client):
+        """Test that retrieving a patient doesn't query per emergency contact."""
+        def retrieve_queries(contact_count):
+            patient = PatientFactory()
+            EmergencyContactFactory.create_batch(contact_count, patient=patient)
+            url = reverse("patients:patient-detail", args=[patient.pk])
+            with CaptureQueriesContext(connection) as ctx:
+                response = authenticated_client.get(url)
+            assert response.status_code == status.HTTP_200_OK
+            return len(ctx.captured_queries)
+
+        assert retrieve_queries(5) == retrieve_queries(1)
+
+    def test_list_payload_matches_list_serializer(self, authenticated_client):
+        """Test that the values()-based list renders exactly like PatientListSerializer."""
+        from apps.patients.serializers import PatientListSerializer
+
+        PatientFactory.create_batch(3)
+        PatientFactory(email="", blood_type="")
+
+        response = authenticated_client.get(PATIENTS_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        expected = PatientListSerializer(
+            Patient.objects.order_by("-enrolled_date", "-id"), many=True
+        ).data
+        assert response.data["results"] == expected
+
+
+@pytest.mark.django_db
+class TestPatientViewSetConditionalGet:
+    """Test ETag handling on the patient list and detail endpoints."""
+
+    def test_list_returns_304_for_matching_etag(self, client_any):
+        """Test that an unchanged list answers If-None-Match with 304."""
+        PatientFactory.create_batch(2)
+        response = client_any.get(PATIENTS_URL)
+        etag = response["ETag"]
+
+        response = client_any.get(PATIENTS_URL, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_list_etag_changes_when_patient_changes(self, authenticated_client):
+        """Test that saving or adding a patient invalidates the list ETag."""
+        patient = PatientFactory()
+        etag = authenticated_client.get(PATIENTS_URL)["ETag"]
+
+        patient.first_name = "Renamed"
+        patient.save()
+        response = authenticated_client.get(PATIENTS_URL, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+
+        etag = response["ETag"]
+        PatientFactory()
+        response = authenticated_client.get(PATIENTS_URL, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_list_etag_changes_when_patient_deleted(self, authenticated_client):
+        """Test that removing a listed patient invalidates the list ETag."""
+        patients = PatientFactory.create_batch(2)
+        etag = authenticated_client.get(PATIENTS_URL)["ETag"]
+
+        patients[0].delete()
+        response = authenticated_client.get(PATIENTS_URL, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["results"]) == 1
+
+    def test_list_etag_changes_with_the_date(self, authenticated_client, monkeypatch):
+        """Test that the ETag rolls over with the day, since ``age`` is derived."""
+        from datetime import date, timedelta
+        from apps.patients import views
+
+        PatientFactory()
+        etag = authenticated_client.get(PATIENTS_URL)["ETag"]
+
+        class Tomorrow(date):
+            @classmethod
+            def today(cls):
+                return date.today() + timedelta(days=1)
+
+        monkeypatch.setattr(views, "date", Tomorrow)
+        response = authenticated_client.get(PATIENTS_URL, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_list_etag_differs_per_query_string(self, authenticated_client):
+        """Test that filtered lists do not share an ETag."""
+        PatientFactory()
+
+        etag = authenticated_client.get(PATIENTS_URL)["ETag"]
+
+        assert authenticated_client.get(f"{PATIENTS_URL}?gender=F")["ETag"] != etag
+
+    def test_retrieve_returns_304_for_matching_etag(self, authenticated_client):
+        """Test that an unchanged patient answers If-None-Match with 304."""
+        patient = PatientFactory()
+        url = reverse("patients:patient-detail", args=[patient.pk])
+        etag = authenticated_client.get(url)["ETag"]
+
+        response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_retrieve_etag_changes_with_nested_records(self, authenticated_client):
+        """Test that address and contact changes invalidate the detail ETag."""
+        patient = PatientFactory()
+        url = reverse("patients:patient-detail", args=[patient.pk])
+        etag = authenticated_client.get(url)["ETag"]
+
+        AddressFactory(patient=patient)
+        response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+
+        etag = response["ETag"]
+        contact = EmergencyContactFactory(patient=patient)
+        response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+
+        etag = response["ETag"]
+        contact.delete()
+        response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_retrieve_missing_patient_still_404(self, authenticated_client):
+        """Test that unknown patients are not given an ETag."""
+        response = authenticated_client.get(
+            reverse("patients:patient-detail", args=[999999])
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert not response.has_header("ETag")
+
 
 @pytest.mark.django_db
 class TestPatientViewSetGetSerializerClass:
@@ -98,7 +259,9 @@ class TestPatientViewSetCustomActions:
         """Test that deactivate action sets is_active to False."""
         patient = PatientFactory(is_active=True)
         
-        response = authenticated_client.post(f"/api/v1/patients/{patient.pk}/deactivate/")
+        response = authenticated_client.post(
+            reverse("patients:patient-deactivate", args=[patient.pk])
+        )
         
         assert response.status_code == status.HTTP_200_OK
         patient.refresh_from_db()
@@ -108,7 +271,9 @@ class TestPatientViewSetCustomActions:
         """Test that activate action sets is_active to True."""
         patient = PatientFactory(is_active=False)
         
-        response = authenticated_client.post(f"/api/v1/patients/{patient.pk}/activate/")
+        response = authenticated_client.post(
+            reverse("patients:patient-activate", args=[patient.pk])
+        )
         
         assert response.status_code == status.HTTP_200_OK
         patient.refresh_from_db()
@@ -118,12 +283,105 @@ class TestPatientViewSetCustomActions:
         """Test deactivating an already inactive patient."""
         patient = PatientFactory(is_active=False)
         
-        response = authenticated_client.post(f"/api/v1/patients/{patient.pk}/deactivate/")
+        response = authenticated_client.post(
+            reverse("patients:patient-deactivate", args=[patient.pk])
+        )
         
         assert response.status_code == status.HTTP_200_OK
         patient.refresh_from_db()
         assert patient.is_active is False  # Still False
 
+    def test_deactivate_missing_patient_returns_404(self, authenticated_client):
+        """Test that deactivating an unknown patient returns 404."""
+        response = authenticated_client.post(reverse("patients:patient-deactivate", args=[999999]))
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    @pytest.mark.parametrize("pk", ["abc", "0", str(2**63)])
+    @pytest.mark.parametrize("action", ["deactivate", "activate"])
+    def test_status_action_invalid_pk_returns_404(self, authenticated_client, action, pk):
+        """Test that a pk that cannot be a patient id returns 404, not 500."""
+        response = authenticated_client.post(f"{PATIENTS_URL}{pk}/{action}/")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_deactivate_invalidates_cached_stats(self, authenticated_client):
+        """Test that the UPDATE-based deactivate still refreshes cached stats."""
+        patient = PatientFactory(is_active=True)
+        response = authenticated_client.get(STATS_URL)
+        assert response.data["active_patients"] == 1
+
+        authenticated_client.post(reverse("patients:patient-deactivate", args=[patient.pk]))
+
+        response = authenticated_client.get(STATS_URL)
+        assert response.data["active_patients"] == 0
+
+    def test_stats_served_when_cache_is_unreachable(self, authenticated_client, monkeypatch):
+        """Test that a failing cache backend falls back to computed stats."""
+        from django.core.cache import cache
+
+        def unreachable(*args, **kwargs):
+            raise ConnectionError("cache down")
+
+        for method in ("get_or_set", "get", "set", "incr"):
+            monkeypatch.setattr(cache, method, unreachable)
+        PatientFactory.create_batch(2, is_active=True)
+
+        response = authenticated_client.get(STATS_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["active_patients"] == 2
+
+    def test_bulk_deactivate_and_activate(self, authenticated_admin_client):
+        """Test bulk deactivate/activate update only the listed patients."""
+        patients = PatientFactory.create_batch(3, is_active=True)
+        ids = [p.pk for p in patients[:2]]
+
+        response = authenticated_admin_client.post(
+            BULK_DEACTIVATE_URL, {"ids": ids}, format="json"
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["updated"] == 2
+        for patient in patients:
+            patient.refresh_from_db(fields=["is_active"])
+        assert [p.is_active for p in patients] == [False, False, True]
+
+        response = authenticated_admin_client.post(
+            BULK_ACTIVATE_URL, {"ids": ids}, format="json"
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["updated"] == 2
+        assert Patient.objects.filter(is_active=True).count() == 3
+
+    @pytest.mark.parametrize(
+        "body",
+        [{}, {"ids": []}, {"ids": ["abc"]}, {"ids": [[1]]}, {"ids": [0]}, {"ids": 1}, [1]],
+    )
+    def test_bulk_deactivate_rejects_invalid_ids(self, authenticated_admin_client, body):
+        """Test that bulk deactivate answers a bad id list with 400."""
+        response = authenticated_admin_client.post(BULK_DEACTIVATE_URL, body, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_bulk_activate_rejects_too_many_ids(self, authenticated_admin_client):
+        """Test that the bulk id list is capped."""
+        response = authenticated_admin_client.post(
+            BULK_ACTIVATE_URL, {"ids": list(range(1, BULK_IDS_MAX + 2))}, format="json"
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    @pytest.mark.parametrize("url", [BULK_DEACTIVATE_URL, BULK_ACTIVATE_URL])
+    def test_bulk_status_actions_require_staff(self, authenticated_client, url):
+        """Test that non-staff users cannot flip patients in bulk."""
+        patient = PatientFactory(is_active=True)
+
+        response = authenticated_client.post(url, {"ids": [patient.pk]}, format="json")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        patient.refresh_from_db(fields=["is_active"])
+        assert patient.is_active is True
+
     def test_stats_action_returns_correct_counts(self):
         """Test that stats action returns accurate statistics."""
         # Create test data
@@ -133,7 +391,7 @@ class TestPatientViewSetCustomActions:
         
         user = UserFactory()
         factory = APIRequestFactory()
-        request = factory.get("/api/v1/patients/stats/")
+        request = factory.get(STATS_URL)
         request.user = user
         
         viewset = PatientViewSet()
@@ -148,11 +406,45 @@ class TestPatientViewSetCustomActions:
         assert response.data["by_gender"]["M"] == 4
         assert response.data["by_gender"]["F"] == 2
 
+    def test_stats_query_count(self, django_assert_num_queries):
+        """Test that stats uses one aggregate plus one gender grouping query."""
+        PatientFactory.create_batch(2, gender="M")
+        PatientFactory.create_batch(1, gender="O")
+
+        user = UserFactory()
+        factory = APIRequestFactory()
+        request = factory.get(STATS_URL)
+        request.user = user
+
+        viewset = PatientViewSet()
+        viewset.request = request
+
+        with django_assert_num_queries(2):
+            response = viewset.stats(request)
+
+        assert response.data["total_patients"] == 3
+        assert response.data["by_gender"] == {"M": 2, "F": 0, "O": 1}
+
+    def test_stats_cache_invalidated_on_patient_change(self, authenticated_client):
+        """Test that cached stats are recomputed after a patient is saved or deleted."""
+        PatientFactory(is_active=True)
+
+        response = authenticated_client.get(STATS_URL)
+        assert response.data["total_patients"] == 1
+
+        patient = PatientFactory(is_active=True)
+        response = authenticated_client.get(STATS_URL)
+        assert response.data["total_patients"] == 2
+
+        patient.delete()
+        response = authenticated_client.get(STATS_URL)
+        assert response.data["total_patients"] == 1
+
     def test_stats_with_no_patients(self):
         """Test stats action with no patients in database."""
         user = UserFactory()
         factory = APIRequestFactory()
-        request = factory.get("/api/v1/patients/stats/")
+        request = factory.get(STATS_URL)
         request.user = user
         
         viewset = PatientViewSet()
@@ -177,7 +469,7 @@ class TestPatientViewSetFiltering:
         PatientFactory.create_batch(2, enrolled_by=user1)
         PatientFactory.create_batch(3, enrolled_by=user2)
         
-        response = authenticated_client.get(f"/api/v1/patients/?enrolled_by={user1.id}")
+        response = authenticated_client.get(f"{PATIENTS_URL}?enrolled_by={user1.id}")
         
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data["results"]) == 2
@@ -187,32 +479,43 @@ class TestPatientViewSetFiltering:
         PatientFactory.create_batch(3, language_preference="kin")
         PatientFactory.create_batch(2, language_preference="eng")
         
-        response = authenticated_client.get("/api/v1/patients/?language_preference=kin")
+        response = authenticated_client.get(f"{PATIENTS_URL}?language_preference=kin")
         
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data["results"]) == 3
 
-    def test_search_by_national_id(self, authenticated_client):
+    def test_search_by_national_id(self, authenticated_client, patient_cohort):
         """Test searching patients by national ID."""
         patient = PatientFactory(national_id="1234567890123456")
-        PatientFactory.create_batch(3)  # Other patients
+        patient_cohort(3)  # Other patients
         
-        response = authenticated_client.get("/api/v1/patients/?search=123456789")
+        response = authenticated_client.get(f"{PATIENTS_URL}?search=123456789")
         
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data["results"]) == 1
         assert response.data["results"][0]["national_id"] == "1234567890123456"
 
-    def test_search_by_email(self, authenticated_client):
+    def test_search_by_email(self, authenticated_client, patient_cohort):
         """Test searching patients by email."""
         patient = PatientFactory(email="unique.email@test.com")
-        PatientFactory.create_batch(3)
+        patient_cohort(3)
         
-        response = authenticated_client.get("/api/v1/patients/?search=unique.email")
+        response = authenticated_client.get(f"{PATIENTS_URL}?search=unique.email")
         
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data["results"]) == 1
 
+    def test_search_requires_every_term_to_match(self, authenticated_client):
+        """Test that multi-word search ANDs terms across the search fields."""
+        PatientFactory(first_name="Alice", last_name="Uwase")
+        PatientFactory(first_name="Alice", last_name="Mukamana")
+
+        response = authenticated_client.get(f"{PATIENTS_URL}?search=alice uwase")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["results"]) == 1
+        assert response.data["results"][0]["last_name"] == "Uwase"
+
     def test_combined_filters_and_search(self, authenticated_client):
         """Test combining multiple filters and search."""
         PatientFactory(
@@ -235,7 +538,7 @@ class TestPatientViewSetFiltering:
         )
         
         response = authenticated_client.get(
-            "/api/v1/patients/?gender=M&is_active=true&search=John"
+            f"{PATIENTS_URL}?gender=M&is_active=true&search=John"
         )
         
         assert response.status_code == status.HTTP_200_OK
@@ -253,7 +556,7 @@ class TestPatientViewSetOrdering:
         PatientFactory(last_name="Apple")
         PatientFactory(last_name="Mango")
         
-        response = authenticated_client.get("/api/v1/patients/?ordering=last_name")
+        response = authenticated_client.get(f"{PATIENTS_URL}?ordering=last_name")
         
         assert response.status_code == status.HTTP_200_OK
         results = response.data["results"]
@@ -265,7 +568,7 @@ class TestPatientViewSetOrdering:
         PatientFactory(last_name="Apple")
         PatientFactory(last_name="Mango")
         
-        response = authenticated_client.get("/api/v1/patients/?ordering=-last_name")
+        response = authenticated_client.get(f"{PATIENTS_URL}?ordering=-last_name")
         
         assert response.status_code == status.HTTP_200_OK
         results = response.data["results"]
@@ -279,7 +582,7 @@ class TestPatientViewSetOrdering:
         PatientFactory(date_of_birth=date(1985, 1, 1))
         PatientFactory(date_of_birth=date(1995, 1, 1))
         
-        response = authenticated_client.get("/api/v1/patients/?ordering=date_of_birth")
+        response = authenticated_client.get(f"{PATIENTS_URL}?ordering=date_of_birth")
         
         assert response.status_code == status.HTTP_200_OK
         # Oldest should be first
@@ -295,7 +598,7 @@ class TestAddressViewSetFiltering:
         AddressFactory.create_batch(2, district="Gasabo")
         AddressFactory.create_batch(1, district="Kicukiro")
         
-        response = authenticated_client.get("/api/v1/addresses/?district=Gasabo")
+        response = authenticated_client.get(f"{ADDRESSES_URL}?district=Gasabo")
         
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data["results"]) == 2
@@ -305,7 +608,7 @@ class TestAddressViewSetFiltering:
         AddressFactory.create_batch(3, sector="Kimironko")
         AddressFactory.create_batch(2, sector="Remera")
         
-        response = authenticated_client.get("/api/v1/addresses/?sector=Kimironko")
+        response = authenticated_client.get(f"{ADDRESSES_URL}?sector=Kimironko")
         
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data["results"]) == 3
@@ -322,7 +625,7 @@ class TestEmergencyContactViewSetFiltering:
         EmergencyContactFactory.create_batch(1, relationship="sibling")
         
         response = authenticated_client.get(
-            "/api/v1/emergency-contacts/?relationship=parent"
+            f"{EMERGENCY_CONTACTS_URL}?relationship=parent"
         )
         
         assert response.status_code == status.HTTP_200_OK
@@ -335,34 +638,34 @@ class TestViewSetErrorHandling:
 
     def test_invalid_filter_parameter(self, authenticated_client):
         """Test that invalid filter parameters are handled gracefully."""
-        response = authenticated_client.get("/api/v1/patients/?invalid_param=value")
+        response = authenticated_client.get(f"{PATIENTS_URL}?invalid_param=value")
         
         # Should still work, just ignore invalid param
         assert response.status_code == status.HTTP_200_OK
 
-    def test_invalid_ordering_field(self, authenticated_client):
+    def test_invalid_ordering_field(self, authenticated_client, patient_cohort):
         """Test ordering by invalid field."""
-        PatientFactory.create_batch(3)
+        patient_cohort(3)
         
         # Try to order by non-existent field
-        response = authenticated_client.get("/api/v1/patients/?ordering=nonexistent_field")
+        response = authenticated_client.get(f"{PATIENTS_URL}?ordering=nonexistent_field")
         
         # Should return 400 or ignore and use default
         assert response.status_code in [status.HTTP_200_OK, status.HTTP_400_BAD_REQUEST]
 
-    def test_invalid_page_number(self, authenticated_client):
-        """Test requesting invalid page number."""
-        PatientFactory.create_batch(5)
+    def test_invalid_cursor(self, authenticated_client, patient_cohort):
+        """Test requesting an invalid pagination cursor."""
+        patient_cohort(5)
         
-        response = authenticated_client.get("/api/v1/patients/?page=999")
+        response = authenticated_client.get(f"{PATIENTS_URL}?cursor=invalid")
         
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
-    def test_invalid_page_size(self, authenticated_client):
+    def test_invalid_page_size(self, authenticated_client, patient_cohort):
         """Test requesting invalid page size."""
-        PatientFactory.create_batch(5)
+        patient_cohort(5)
         
-        response = authenticated_client.get("/api/v1/patients/?page_size=invalid")
+        response = authenticated_client.get(f"{PATIENTS_URL}?page_size=invalid")
         
         # Should handle gracefully
         assert response.status_code in [status.HTTP_200_OK, status.HTTP_400_BAD_REQUEST]
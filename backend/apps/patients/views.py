@@ -1,16 +1,37 @@
 """
 Views for Patient app.
 """
-from rest_framework import viewsets, filters, status
+import hashlib
+import logging
+from datetime import date
+
+from rest_framework import viewsets, filters, serializers, status
 from rest_framework.decorators import action, api_view, permission_classes
+from rest_framework.pagination import CursorPagination
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework_simplejwt.tokens import RefreshToken
 from django.contrib.auth import authenticate
+from django.core.cache import cache
+from django.db.models import Count, Max, Q
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from django_filters.rest_framework import DjangoFilterBackend
-from apps.core.permissions import IsAuthenticatedUser
-from apps.patients.models import Patient, Address, EmergencyContact
+from drf_spectacular.utils import extend_schema, inline_serializer
+from apps.core.permissions import IsAdmin, IsAuthenticatedUser
+from apps.patients.filters import PatientFilterSet, PrecompiledSearchFilter
+from apps.patients.models import Patient, Address, EmergencyContact, PatientStatsMV
+from apps.patients.signals import (
+    STATS_CACHE_TIMEOUT,
+    STATS_CACHE_VERSION_KEY,
+    bump_stats_cache_version,
+)
 from apps.patients.serializers import (
+    BULK_IDS_MAX,
+    MAX_PATIENT_ID,
+    PatientBulkIdsSerializer,
     PatientListSerializer,
     PatientDetailSerializer,
     PatientCreateSerializer,
@@ -18,10 +39,101 @@ from apps.patients.serializers import (
     AddressSerializer,
     EmergencyContactSerializer,
 )
+from apps.patients.fast_serializers import (
+    FastPatientListSerializer,
+    PATIENT_LIST_VALUES,
+)
 from apps.appointments.models import Appointment
 from apps.enrollment.models import Hospital
 
 
+logger = logging.getLogger(__name__)
+
+# Validates the detail-route pk for actions that skip get_object().
+_PATIENT_ID = serializers.IntegerField(min_value=1, max_value=MAX_PATIENT_ID)
+BULK_IDS_ERROR = f"ids must be a non-empty list of at most {BULK_IDS_MAX} patient ids"
+
+# Every gender choice is reported in stats, including those with no patients.
+GENDER_KEYS = tuple(key for key, _ in Patient.GENDER_CHOICES)
+
+# Schema components for the custom actions. Without them drf-spectacular falls
+# back to PatientDetailSerializer for every action and documents the wrong body.
+_DETAIL_RESPONSE = inline_serializer(
+    "PatientDetailMessage", {"detail": serializers.CharField()}
+)
+_STATUS_RESPONSE = inline_serializer(
+    "PatientStatusMessage", {"status": serializers.CharField()}
+)
+_BULK_STATUS_RESPONSE = inline_serializer(
+    "PatientBulkStatus",
+    {"status": serializers.CharField(), "updated": serializers.IntegerField()},
+)
+_STATS_RESPONSE = inline_serializer(
+    "PatientStats",
+    {
+        "total_patients": serializers.IntegerField(),
+        "active_patients": serializers.IntegerField(),
+        "inactive_patients": serializers.IntegerField(),
+        "new_enrollments_today": serializers.IntegerField(),
+        "new_enrollments_this_week": serializers.IntegerField(),
+        "by_gender": serializers.DictField(child=serializers.IntegerField()),
+    },
+)
+
+
+def patient_list_etag(request, rows, links=()):
+    """
+    ETag for one fetched page of the patient list.
+
+    Built from the page's own rows (id, updated_at) and pagination links, so
+    it changes whenever a patient on the page is added, removed or saved
+    without a query over the whole table. The query string keeps every
+    filter/cursor combination apart, and today's date covers ``age``.
+    """
+    key = "|".join(
+        [
+            request.get_full_path(),
+            date.today().isoformat(),
+            *(f"{row['id']}:{row['updated_at'].isoformat()}" for row in rows),
+            *(link or "" for link in links),
+        ]
+    )
+    return hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()
+
+
+def patient_detail_etag(request, pk=None, *args, **kwargs):
+    """
+    ETag for a single patient, covering its nested address and contacts.
+
+    Returns None for unknown patients so the view answers with its usual 404.
+    """
+    try:
+        state = Patient.objects.filter(pk=pk).aggregate(
+            updated=Max("updated_at"),
+            address=Max("address__updated_at"),
+            contacts=Max("emergency_contacts__updated_at"),
+            contact_count=Count("emergency_contacts"),
+        )
+    except (ValueError, TypeError):
+        return None
+    if state["updated"] is None:
+        return None
+    # The date covers the derived ``age`` field.
+    key = "|".join(str(value) for value in (pk, date.today(), *state.values()))
+    return hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()
+
+
+class PatientCursorPagination(CursorPagination):
+    """
+    Keyset pagination for the patient list.
+
+    Pages are fetched with an indexed range scan on (enrolled_date, id) instead
+    of OFFSET plus a COUNT(*) over the whole table.
+    """
+
+    ordering = ("-enrolled_date", "-id")
+
+
 class PatientViewSet(viewsets.ModelViewSet):
     """
     ViewSet for managing patients.
@@ -29,12 +141,11 @@ class PatientViewSet(viewsets.ModelViewSet):
     Provides CRUD operations for patients with filtering, search, and ordering.
     """
 
-    queryset = Patient.objects.select_related("enrolled_by", "address").prefetch_related(
-        "emergency_contacts"
-    )
+    queryset = Patient.objects.select_related("enrolled_by", "address")
     permission_classes = [IsAuthenticatedUser]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ["is_active", "gender", "language_preference", "enrolled_by"]
+    pagination_class = PatientCursorPagination
+    filter_backends = [DjangoFilterBackend, PrecompiledSearchFilter, filters.OrderingFilter]
+    filterset_class = PatientFilterSet
     search_fields = [
         "first_name",
         "last_name",
@@ -43,7 +154,28 @@ class PatientViewSet(viewsets.ModelViewSet):
         "email",
     ]
     ordering_fields = ["enrolled_date", "last_name", "date_of_birth"]
-    ordering = ["-enrolled_date"]
+    ordering = ["-enrolled_date", "-id"]
+
+    # Actions rendered with PatientDetailSerializer, which nests emergency contacts.
+    detail_actions = ("retrieve", "update", "partial_update")
+    # Actions rendered in PatientListSerializer shape, which needs no relations.
+    list_actions = ("list", "search")
+
+    def get_queryset(self):
+        """
+        Shape the queryset for the current action.
+
+        List-style actions read only the list columns and skip the joins;
+        detail actions also prefetch emergency contacts.
+        """
+        action = getattr(self, "action", None)
+        if action in self.list_actions:
+            return Patient.objects.only(*PATIENT_LIST_VALUES)
+
+        queryset = super().get_queryset()
+        if action in self.detail_actions:
+            queryset = queryset.prefetch_related("emergency_contacts")
+        return queryset
 
     def get_serializer_class(self):
         """Return appropriate serializer based on action."""
@@ -53,6 +185,41 @@ class PatientViewSet(viewsets.ModelViewSet):
             return PatientCreateSerializer
         return PatientDetailSerializer
 
+    @method_decorator(condition(etag_func=patient_detail_etag))
+    def retrieve(self, request, *args, **kwargs):
+        """Retrieve a patient; answers 304 when If-None-Match is current."""
+        return super().retrieve(request, *args, **kwargs)
+
+    def list(self, request, *args, **kwargs):
+        """
+        List patients from a values() projection.
+
+        The payload matches PatientListSerializer (still used for the schema),
+        but rows are rendered by FastPatientListSerializer from plain dicts.
+        The ETag is taken from the fetched page, so an unchanged page answers
+        If-None-Match with 304 before any rendering.
+        """
+        queryset = self.filter_queryset(self.get_queryset()).values(
+            *PATIENT_LIST_VALUES, "updated_at"
+        )
+
+        page = self.paginate_queryset(queryset)
+        if page is None:
+            rows, links = list(queryset), ()
+        else:
+            rows = page
+            links = (self.paginator.get_next_link(), self.paginator.get_previous_link())
+
+        etag = quote_etag(patient_list_etag(request, rows, links))
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            data = FastPatientListSerializer(rows).data
+            response = (
+                Response(data) if page is None else self.get_paginated_response(data)
+            )
+        response.headers["ETag"] = etag
+        return response
+
     @action(detail=False, methods=["get", "patch"])
     def me(self, request):
         """Get or update current patient's data based on JWT token."""
@@ -116,28 +283,106 @@ class PatientViewSet(viewsets.ModelViewSet):
             'detail': 'Password changed successfully'
         }, status=status.HTTP_200_OK)
 
+    def _set_active(self, queryset, is_active):
+        """Flip is_active with a single UPDATE and return the rows changed."""
+        updated = queryset.update(is_active=is_active, updated_at=timezone.now())
+        if updated:
+            # update() bypasses post_save, so invalidate cached stats here.
+            bump_stats_cache_version()
+        return updated
+
+    def _patient_by_pk(self, pk):
+        """Queryset for the URL pk; empty (no query) if pk is not a valid id."""
+        try:
+            pk = _PATIENT_ID.run_validation(pk)
+        except serializers.ValidationError:
+            return Patient.objects.none()
+        return Patient.objects.filter(pk=pk)
+
+    def _bulk_ids(self, request):
+        """Return the list of patient ids posted as ``ids``, or None if invalid."""
+        serializer = PatientBulkIdsSerializer(data=request.data)
+        if not serializer.is_valid():
+            return None
+        return serializer.validated_data["ids"]
+
+    @extend_schema(
+        request=None, responses={200: _STATUS_RESPONSE, 404: _DETAIL_RESPONSE}
+    )
     @action(detail=True, methods=["post"])
     def deactivate(self, request, pk=None):
         """Deactivate a patient (soft delete)."""
-        patient = self.get_object()
-        patient.is_active = False
-        patient.save()
+        if not self._set_active(self._patient_by_pk(pk), False):
+            return Response(
+                {"detail": "Patient not found."}, status=status.HTTP_404_NOT_FOUND
+            )
         return Response(
             {"status": "Patient deactivated successfully"},
             status=status.HTTP_200_OK,
         )
 
+    @extend_schema(
+        request=None, responses={200: _STATUS_RESPONSE, 404: _DETAIL_RESPONSE}
+    )
     @action(detail=True, methods=["post"])
     def activate(self, request, pk=None):
         """Reactivate a patient."""
-        patient = self.get_object()
-        patient.is_active = True
-        patient.save()
+        if not self._set_active(self._patient_by_pk(pk), True):
+            return Response(
+                {"detail": "Patient not found."}, status=status.HTTP_404_NOT_FOUND
+            )
         return Response(
             {"status": "Patient activated successfully"},
             status=status.HTTP_200_OK,
         )
 
+    @extend_schema(
+        request=PatientBulkIdsSerializer,
+        responses={
+            200: _BULK_STATUS_RESPONSE,
+            400: _DETAIL_RESPONSE,
+            403: _DETAIL_RESPONSE,
+        },
+    )
+    @action(detail=False, methods=["post"], permission_classes=[IsAdmin])
+    def bulk_deactivate(self, request):
+        """Deactivate several patients at once (staff only). Body: {"ids": [1, 2, ...]}."""
+        ids = self._bulk_ids(request)
+        if ids is None:
+            return Response(
+                {"detail": BULK_IDS_ERROR},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        updated = self._set_active(Patient.objects.filter(pk__in=ids), False)
+        return Response(
+            {"status": f"{updated} patients deactivated", "updated": updated},
+            status=status.HTTP_200_OK,
+        )
+
+    @extend_schema(
+        request=PatientBulkIdsSerializer,
+        responses={
+            200: _BULK_STATUS_RESPONSE,
+            400: _DETAIL_RESPONSE,
+            403: _DETAIL_RESPONSE,
+        },
+    )
+    @action(detail=False, methods=["post"], permission_classes=[IsAdmin])
+    def bulk_activate(self, request):
+        """Reactivate several patients at once (staff only). Body: {"ids": [1, 2, ...]}."""
+        ids = self._bulk_ids(request)
+        if ids is None:
+            return Response(
+                {"detail": BULK_IDS_ERROR},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        updated = self._set_active(Patient.objects.filter(pk__in=ids), True)
+        return Response(
+            {"status": f"{updated} patients activated", "updated": updated},
+            status=status.HTTP_200_OK,
+        )
+
+    @extend_schema(responses=PatientListSerializer(many=True))
     @action(detail=False, methods=["get"])
     def search(self, request):
         """
@@ -235,6 +480,8 @@ class PatientViewSet(viewsets.ModelViewSet):
             else:
                 queryset = queryset.order_by(f'-{sort_field}')
         
+        queryset = queryset.values(*PATIENT_LIST_VALUES)
+
         # Limit results
         limit = request.query_params.get('limit')
         if limit:
@@ -244,44 +491,70 @@ class PatientViewSet(viewsets.ModelViewSet):
             except (ValueError, TypeError):
                 pass
         
-        # Use list serializer
-        serializer = PatientListSerializer(queryset, many=True)
-        return Response(serializer.data)
+        # Same payload as PatientListSerializer
+        return Response(FastPatientListSerializer(queryset).data)
 
+    @extend_schema(responses=_STATS_RESPONSE)
     @action(detail=False, methods=["get"])
     def stats(self, request):
-        """Get patient statistics."""
-        from django.utils import timezone
+        """
+        Get patient statistics (cached until the next patient change).
+
+        With PATIENT_STATS_USE_MATVIEW the figures come from the
+        patient_stats_mv materialized view, so they are as of its last refresh
+        (every 5 minutes).
+        """
+        # Cache backend errors (e.g. Redis unreachable) have no common base
+        # class; as in bump_stats_cache_version, they must not fail the
+        # request, so fall back to computing the stats.
+        try:
+            version = cache.get_or_set(STATS_CACHE_VERSION_KEY, 1, timeout=None)
+            cache_key = f"patients:stats:{version}"
+            payload = cache.get(cache_key)
+        except Exception:
+            logger.warning("Could not read cached patient stats", exc_info=True)
+            return Response(self._compute_stats())
+        if payload is None:
+            payload = self._compute_stats()
+            try:
+                cache.set(cache_key, payload, timeout=STATS_CACHE_TIMEOUT)
+            except Exception:
+                logger.warning("Could not cache patient stats", exc_info=True)
+        return Response(payload)
+
+    def _compute_stats(self):
+        """Aggregate the figures served by the stats action."""
         from datetime import timedelta
         
-        total = Patient.objects.count()
-        active = Patient.objects.filter(is_active=True).count()
-        inactive = total - active
-        
         # Enrollment stats
         today = timezone.now().date()
         week_ago = today - timedelta(days=7)
+
+        if PatientStatsMV.is_available():
+            return PatientStatsMV.as_dict(today, week_ago, GENDER_KEYS)
+        
+        counts = Patient.objects.aggregate(
+            total=Count("id"),
+            active=Count("id", filter=Q(is_active=True)),
+            new_today=Count("id", filter=Q(enrolled_date__date=today)),
+            new_this_week=Count("id", filter=Q(enrolled_date__date__gte=week_ago)),
+        )
         
-        new_enrollments_today = Patient.objects.filter(
-            enrolled_date__date=today
-        ).count()
-        
-        new_enrollments_this_week = Patient.objects.filter(
-            enrolled_date__date__gte=week_ago
-        ).count()
-        
-        by_gender = {}
-        for gender, _ in Patient.GENDER_CHOICES:
-            by_gender[gender] = Patient.objects.filter(gender=gender).count()
+        by_gender = dict.fromkeys(GENDER_KEYS, 0)
+        by_gender.update(
+            Patient.objects.order_by()
+            .values_list("gender")
+            .annotate(count=Count("id"))
+        )
 
-        return Response({
-            "total_patients": total,
-            "active_patients": active,
-            "inactive_patients": inactive,
-            "new_enrollments_today": new_enrollments_today,
-            "new_enrollments_this_week": new_enrollments_this_week,
+        return {
+            "total_patients": counts["total"],
+            "active_patients": counts["active"],
+            "inactive_patients": counts["total"] - counts["active"],
+            "new_enrollments_today": counts["new_today"],
+            "new_enrollments_this_week": counts["new_this_week"],
             "by_gender": by_gender,
-        })
+        }
     
     @action(detail=True, methods=["get"])
     def export_data(self, request, pk=None):
@@ -64,6 +64,11 @@ app.conf.beat_schedule = {
         "task": "apps.appointments.tasks.send_appointment_reminders",
         "schedule": crontab(hour=9, minute=0),  # Daily at 9:00 AM
     },
+    # Refresh the patient stats materialized view every 5 minutes
+    "refresh-patient-stats": {
+        "task": "apps.patients.tasks.refresh_patient_stats",
+        "schedule": crontab(minute="*/5"),  # Every 5 minutes
+    },
     # NEW: Check for missed appointments every hour
     "notify-missed-appointments": {
         "task": "apps.appointments.tasks.notify_missed_appointments",
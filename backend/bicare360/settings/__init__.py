@@ -2,13 +2,28 @@
 Settings package for bicare360.
 Loads appropriate settings based on ENVIRONMENT variable.
 """
+import importlib
 import os
 
-environment = os.environ.get("ENVIRONMENT", "development")
+_SETTINGS_MODULES = {
+    "production": ".prod",
+    "test": ".test",
+}
 
-if environment == "production":
-    from .prod import *
-elif environment == "test":
-    from .test import *
-else:
-    from .dev import *
+# Only needed when DJANGO_SETTINGS_MODULE points at this package itself
+# (manage.py's default). When it names a submodule such as
+# bicare360.settings.dev, Python still runs this file first; skip loading a
+# second, unused settings module in that case.
+#
+# import_module() already returns the cached module from sys.modules on
+# repeat imports, and __pycache__ holds the compiled bytecode. Settings are
+# not cached any further (e.g. pickled): their values come from environment
+# variables, so a cache keyed on file mtimes would serve stale configuration.
+if os.environ.get("DJANGO_SETTINGS_MODULE", __name__) == __name__:
+    environment = os.environ.get("ENVIRONMENT", "development")
+    _settings = importlib.import_module(
+        _SETTINGS_MODULES.get(environment, ".dev"), __name__
+    )
+    globals().update(
+        {name: value for name, value in vars(_settings).items() if name.isupper()}
+    )
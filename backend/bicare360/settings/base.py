@@ -243,6 +243,11 @@ CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = TIME_ZONE
 
+# Serve patient stats from the patient_stats_mv materialized view (PostgreSQL,
+# refreshed every 5 minutes by Celery beat) instead of live aggregates. Off by
+# default: the figures then lag writes by up to one refresh.
+PATIENT_STATS_USE_MATVIEW = env.bool("PATIENT_STATS_USE_MATVIEW", default=False)
+
 # Africa's Talking Configuration
 AFRICASTALKING_USERNAME = env("AFRICASTALKING_USERNAME", default="sandbox")
 AFRICASTALKING_API_KEY = env("AFRICASTALKING_API_KEY", default="")
@@ -33,15 +33,18 @@ CHANNEL_LAYERS = {
 #     },
 # }
 
-# Development-specific apps (commented out if not installed)
-INSTALLED_APPS += [
-    # "django_extensions",
-    # "debug_toolbar",
-]
+# Development tools, opt-in: DJANGO_DEBUG_TOOLBAR=1 (requirements/dev.txt).
+# Debug Toolbar wraps every query and template render, so it stays off unless
+# asked for.
+if env.bool("DJANGO_DEBUG_TOOLBAR", default=False):
+    INSTALLED_APPS += [
+        "django_extensions",
+        "debug_toolbar",
+    ]
 
-MIDDLEWARE += [
-    # "debug_toolbar.middleware.DebugToolbarMiddleware",
-]
+    MIDDLEWARE += [
+        "debug_toolbar.middleware.DebugToolbarMiddleware",
+    ]
 
 # Debug Toolbar
 INTERNAL_IPS = ["127.0.0.1", "localhost"]
@@ -69,5 +72,17 @@ LOGGING = {
             "level": "INFO",
             "propagate": False,
         },
+        # Pinned so turning "django" up to DEBUG doesn't also log every SQL
+        # query (DEBUG=True records them all); request 4xx/5xx still show.
+        "django.db.backends": {
+            "handlers": ["console"],
+            "level": "WARNING",
+            "propagate": False,
+        },
+        "django.request": {
+            "handlers": ["console"],
+            "level": "WARNING",
+            "propagate": False,
+        },
     },
 }
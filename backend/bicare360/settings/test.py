@@ -3,7 +3,11 @@ Test settings for bicare360 project.
 """
 from .base import *
 
-# Use in-memory database for tests
+# Use in-memory database for tests (CI); to keep it on disk, see TEST_DB_PATH
+# in conftest.py. Django names the in-memory test database
+# file:memorydb_default?mode=memory&cache=shared, so every connection in a
+# process (threads, async/channels tests) shares one schema; each xdist worker
+# is its own process and gets its own copy.
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
@@ -11,12 +15,14 @@ DATABASES = {
     }
 }
 
-# Faster password hashing for tests
+# No-op password hashing for tests (plain text; see bicare360.testing.hashers)
 PASSWORD_HASHERS = [
-    "django.contrib.auth.hashers.MD5PasswordHasher",
+    "bicare360.testing.hashers.NoopHasher",
 ]
 
-# Disable migrations for faster tests
+# Disable migrations for faster tests. MigrationLoader checks
+# `app_label in MIGRATION_MODULES` before indexing, so this cannot be a
+# defaultdict: its __contains__ is False for keys never accessed.
 class DisableMigrations:
     def __contains__(self, item):
         return True
@@ -27,12 +33,16 @@ class DisableMigrations:
 
 MIGRATION_MODULES = DisableMigrations()
 
-# Use console email backend for tests
-EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
+# In-memory email backend for tests: messages land in django.core.mail.outbox
+EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
 
 # Celery eager mode for synchronous task execution in tests
 CELERY_TASK_ALWAYS_EAGER = True
 CELERY_TASK_EAGER_PROPAGATES = True
+# Eager results live on the returned EagerResult; don't also write them to
+# a backend (base.py points it at Redis, which tests don't run).
+CELERY_TASK_STORE_EAGER_RESULT = False
+CELERY_RESULT_BACKEND = "cache+memory://"
 
 # Disable pagination in tests for easier testing
 REST_FRAMEWORK = {
@@ -0,0 +1,3 @@
+"""
+Helpers used only by the test settings.
+"""
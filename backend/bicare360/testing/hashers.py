@@ -0,0 +1,33 @@
+"""
+Password hashers for the test settings.
+
+NEVER use these outside tests: passwords are stored in plain text.
+"""
+from django.contrib.auth.hashers import BasePasswordHasher
+from django.utils.crypto import constant_time_compare
+
+
+class NoopHasher(BasePasswordHasher):
+    """Store passwords as ``noop$<password>``; no hashing and no salt."""
+
+    algorithm = "noop"
+
+    def salt(self):
+        return ""
+
+    def encode(self, password, salt):
+        return f"{self.algorithm}${password}"
+
+    def decode(self, encoded):
+        algorithm, password = encoded.split("$", 1)
+        assert algorithm == self.algorithm
+        return {"algorithm": algorithm, "hash": password, "salt": ""}
+
+    def verify(self, password, encoded):
+        return constant_time_compare(encoded, self.encode(password, ""))
+
+    def safe_summary(self, encoded):
+        return {"algorithm": self.algorithm}
+
+    def harden_runtime(self, password, encoded):
+        pass
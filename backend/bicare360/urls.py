@@ -36,9 +36,9 @@ urlpatterns = [
     path("api/docs/", SpectacularSwaggerView.as_view(url_name="schema"), name="swagger-ui"),
 ]
 
-# Debug Toolbar URLs (only in development) - Commented out, install with: uv add django-debug-toolbar
-# if settings.DEBUG:
-#     import debug_toolbar
-#     urlpatterns = [
-#         path("__debug__/", include(debug_toolbar.urls)),
-#     ] + urlpatterns
+# Debug Toolbar URLs (only when enabled with DJANGO_DEBUG_TOOLBAR=1 in dev)
+if settings.DEBUG and "debug_toolbar" in settings.INSTALLED_APPS:
+    import debug_toolbar
+    urlpatterns = [
+        path("__debug__/", include(debug_toolbar.urls)),
+    ] + urlpatterns
@@ -1,47 +1,151 @@
 """
 Pytest configuration and fixtures for bicare360 tests.
 """
+import inspect
+import json
 import os
+from collections import defaultdict
+from datetime import date, time, timedelta
+from functools import lru_cache
+from pathlib import Path
+from types import SimpleNamespace
+
 import django
+import pytest
+from django.apps import apps
 
-# Configure Django settings before any Django imports
+# Configure Django settings before any Django imports.
+# pytest-django normally sets Django up already (DJANGO_SETTINGS_MODULE is
+# declared in pyproject.toml); only fall back to setup() when it has not, so the
+# app registry and logging config are not rebuilt a second time.
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'bicare360.settings.dev')
-django.setup()
+if not apps.ready:
+    django.setup()
 
-import pytest
-from datetime import time, date, timedelta
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
 from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
 
-User = get_user_model()
 
+@lru_cache(maxsize=None)
+def _cached_access_token(user_id, username):
+    """Sign one access token per user for the whole run.
 
-@pytest.fixture
-def api_client():
-    """Return an API client for testing."""
+    Module level rather than inside a fixture so the cache outlives a single
+    test. Keyed on the username as well as the id: rolled-back tests free
+    their pks, so a later test's user can get the same id. Tokens stay valid
+    for SIMPLE_JWT's ACCESS_TOKEN_LIFETIME (1 hour).
+    """
+    return str(AccessToken.for_user(get_user_model().objects.get(pk=user_id)))
+
+
+@pytest.fixture(scope="session")
+def _session_api_client():
+    """One APIClient (and its loaded middleware chain) for the whole run."""
     return APIClient()
 
 
 @pytest.fixture
-def authenticated_client(db, api_client):
+def api_client(_session_api_client):
+    """Return an API client for testing, anonymous at the start of each test."""
+    yield _session_api_client
+    # Reset without logout(), which would create and save a session row.
+    _session_api_client.force_authenticate(user=None)
+    _session_api_client.credentials()
+    _session_api_client.cookies.clear()
+
+
+# Users shared by every test that asks for an authenticated client. The names
+# are deliberately ones no test creates itself.
+SESSION_USERS = {
+    "user": {
+        "username": "fixture_user",
+        "email": "fixture.user@example.com",
+        "password": "testpass123",
+    },
+    "admin": {
+        "username": "fixture_admin",
+        "email": "fixture.admin@example.com",
+        "password": "adminpass123",
+        "is_staff": True,
+        "is_superuser": True,
+    },
+}
+
+
+def _build_session_user(key):
+    """Build an unsaved shared user; plain User() skips the manager's extras."""
+    fields = dict(SESSION_USERS[key])
+    password = fields.pop("password")
+    user = get_user_model()(**fields)
+    user.set_password(password)
+    return user
+
+
+def _get_session_user(key):
+    """Fetch a shared user, creating it if missing (e.g. after a flush)."""
+    User = get_user_model()
+    user = User.objects.filter(username=SESSION_USERS[key]["username"]).first()
+    if user is None:
+        user = _build_session_user(key)
+        user.save()
+    return user
+
+
+@pytest.fixture(scope="session")
+def _session_users(django_db_setup, django_db_blocker):
+    """Create the shared users once, committed outside any test transaction.
+
+    One bulk INSERT for whichever are missing; with --reuse-db they also
+    survive between runs.
+    """
+    User = get_user_model()
+    with django_db_blocker.unblock():
+        existing = set(
+            User.objects.filter(
+                username__in=[fields["username"] for fields in SESSION_USERS.values()]
+            ).values_list("username", flat=True)
+        )
+        User.objects.bulk_create(
+            _build_session_user(key)
+            for key, fields in SESSION_USERS.items()
+            if fields["username"] not in existing
+        )
+
+
+@pytest.fixture
+def session_user(db, _session_users):
+    """Return a fresh instance of the shared regular user (one SELECT)."""
+    return _get_session_user("user")
+
+
+@pytest.fixture
+def authenticated_client(db, api_client, session_user):
     """Return an authenticated API client."""
-    user = User.objects.create_user(
-        username="testuser",
-        email="test@example.com",
-        password="testpass123",
-    )
-    api_client.force_authenticate(user=user)
+    api_client.force_authenticate(user=session_user)
     return api_client
 
 
 @pytest.fixture
-def admin_user(db):
-    """Create and return an admin user."""
-    return User.objects.create_superuser(
-        username="admin",
-        email="admin@example.com",
-        password="adminpass123",
-    )
+def jwt_for(db):
+    """Return a function giving a cached JWT access token for a user."""
+    return lambda user: _cached_access_token(user.pk, user.get_username())
+
+
+@pytest.fixture
+def request_ctx(db):
+    """Serializer context with a minimal request carrying a fresh user."""
+    from apps.patients.tests.factories import UserFactory
+
+    return {"request": SimpleNamespace(user=UserFactory())}
+
+
+@pytest.fixture
+def admin_user(db, _session_users):
+    """Return a fresh instance of the shared admin user (one SELECT)."""
+    return _get_session_user("admin")
 
 
 @pytest.fixture
@@ -51,10 +155,144 @@ def authenticated_admin_client(db, api_client, admin_user):
     return api_client
 
 
+@pytest.fixture(params=["user", "admin"])
+def client_any(request, db, api_client, _session_users):
+    """API client authenticated as each shared user in turn.
+
+    Tests using it run once as the regular user and once as the admin, for
+    behaviour that must not depend on the caller's role.
+    """
+    api_client.force_authenticate(user=_get_session_user(request.param))
+    return api_client
+
+
+@pytest.fixture(scope="session")
+def _test_db_path():
+    """Keep the SQLite test database on disk when TEST_DB_PATH is set.
+
+    e.g. TEST_DB_PATH=test_db.sqlite3: with --reuse-db later runs skip
+    creating the schema. The default stays in-memory (CI).
+    """
+    from django.conf import settings
+
+    path = os.environ.get("TEST_DB_PATH")
+    db_settings = settings.DATABASES["default"]
+    if path and db_settings["ENGINE"] == "django.db.backends.sqlite3":
+        db_settings.setdefault("TEST", {})["NAME"] = path
+
+
+@pytest.fixture(scope="session")
+def django_db_modify_db_settings(_test_db_path, django_db_modify_db_settings_parallel_suffix):
+    """Apply TEST_DB_PATH before pytest-django adds each xdist worker's suffix."""
+
+
+@pytest.fixture(autouse=True, scope="session")
+def noop_password_hasher():
+    """Skip password hashing for the whole run, as settings.test does.
+
+    The suite runs on the dev settings (which keep real hashers), and users
+    are created with passwords all over the tests.
+    """
+    from django.test.utils import override_settings
+
+    with override_settings(PASSWORD_HASHERS=["bicare360.testing.hashers.NoopHasher"]):
+        yield
+
+
+@pytest.fixture(autouse=True, scope="session")
+def celery_eager():
+    """Run Celery tasks inline, as settings.test does, without Redis.
+
+    The suite runs on the dev settings, and the Celery app reads its config
+    when first used, so override settings cannot reach it; update app.conf
+    directly. Results stay on the EagerResult instead of a result backend.
+    """
+    from bicare360.celery import app
+
+    overrides = {
+        "task_always_eager": True,
+        "task_eager_propagates": True,
+        "task_store_eager_result": False,
+        "broker_url": "memory://",
+        "result_backend": "cache+memory://",
+    }
+    previous = {key: app.conf[key] for key in overrides}
+    app.conf.update(overrides)
+    yield
+    app.conf.update(previous)
+
+
 @pytest.fixture(autouse=True)
-def enable_db_access_for_all_tests(db):
-    """Automatically enable database access for all tests."""
-    pass
+def locmem_cache(settings):
+    """Give each test an empty in-memory cache.
+
+    Cached API payloads (e.g. patient stats) must not leak between tests whose
+    database writes have been rolled back, and tests must not need Redis.
+    """
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+    yield
+    cache.clear()
+
+
+# Fixture scope profiling. BICARE_PROFILE_FIXTURE_SCOPES=1 counts the SQL
+# each fixture's setup runs and, at the end of the session, writes
+# .pytest_fixture_scopes.json. Function-scoped fixtures set up more than once
+# without writing to the database are listed as session-scope candidates:
+# review each before promoting it, since a fixture can still return objects
+# tests mutate. Run with -n 0 to profile the whole suite in one file.
+PROFILE_FIXTURE_SCOPES = bool(os.environ.get("BICARE_PROFILE_FIXTURE_SCOPES"))
+WRITE_STATEMENTS = ("INSERT", "UPDATE", "DELETE")
+_fixture_profile = defaultdict(lambda: {"setups": 0, "queries": 0, "writes": 0})
+
+
+def _is_project_fixture(fixturedef, request):
+    """True for fixtures defined in this repo (not pytest, plugins or params)."""
+    try:
+        path = Path(inspect.getfile(fixturedef.func)).resolve()
+    except TypeError:
+        return False
+    return path.is_relative_to(request.config.rootpath) and "site-packages" not in path.parts
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    if not PROFILE_FIXTURE_SCOPES or not _is_project_fixture(fixturedef, request):
+        yield
+        return
+
+    stats = _fixture_profile[fixturedef.argname]
+    stats["scope"] = fixturedef.scope
+    stats["setups"] += 1
+
+    def count(execute, sql, params, many, context):
+        stats["queries"] += 1
+        if sql.lstrip().upper().startswith(WRITE_STATEMENTS):
+            stats["writes"] += 1
+        return execute(sql, params, many, context)
+
+    # Dependencies are already set up by now, so only this fixture's own
+    # queries are counted.
+    with connection.execute_wrapper(count):
+        yield
+
+
+def pytest_sessionfinish(session):
+    if not PROFILE_FIXTURE_SCOPES or not _fixture_profile:
+        return
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    name = f".pytest_fixture_scopes.{worker}.json" if worker else ".pytest_fixture_scopes.json"
+    candidates = sorted(
+        argname
+        for argname, stats in _fixture_profile.items()
+        if stats["scope"] == "function" and stats["setups"] > 1 and not stats["writes"]
+    )
+    report = {
+        "session_scope_candidates": candidates,
+        "fixtures": dict(sorted(_fixture_profile.items())),
+    }
+    (session.config.rootpath / name).write_text(json.dumps(report, indent=2) + "\n")
 
 
 # Medication & Prescription Factories
@@ -130,6 +368,41 @@ def adherence_factory(db, prescription_factory):
     return create_adherence
 
 
+@pytest.fixture(scope="session")
+def patient_cohort_rows():
+    """Field values for 50 patients, built once per session.
+
+    Building through PatientFactory (Faker, sequences) is the slow part of
+    creating test patients; nothing is written to the database here.
+    """
+    from apps.patients.models import Patient
+    from apps.patients.tests.factories import PatientFactory
+
+    fields = [f.attname for f in Patient._meta.concrete_fields if not f.primary_key]
+    return [
+        {name: getattr(patient, name) for name in fields}
+        for patient in PatientFactory.build_batch(50, skip_related=True)
+    ]
+
+
+@pytest.fixture
+def patient_cohort(db, patient_cohort_rows):
+    """Insert the first ``count`` cohort patients with a single bulk INSERT.
+
+    Rows are written inside the test's transaction, so they are rolled back
+    like any other test data. Use factories for patients a test modifies or
+    needs specific values on.
+    """
+    from apps.patients.models import Patient
+
+    def create_cohort(count=len(patient_cohort_rows)):
+        return Patient.objects.bulk_create(
+            [Patient(**row) for row in patient_cohort_rows[:count]]
+        )
+
+    return create_cohort
+
+
 @pytest.fixture
 def patient_factory(db):
     """Factory for creating patients"""